@@ -140,6 +140,11 @@ def edit_tab_handler(course_item, request):
         )
 
     if 'is_hidden' in request.json:
+        if not tab.is_hideable:
+            return JsonResponse(
+                {"error": "Tab with id_locator '{0}' cannot be hidden.".format(tab_id_locator)}, status=400
+            )
+
         # set the is_hidden attribute on the requested tab
         tab.is_hidden = request.json['is_hidden']
         modulestore().update_item(course_item, request.user.id)
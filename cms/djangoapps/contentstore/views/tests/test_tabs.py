@@ -8,7 +8,7 @@ from contentstore.utils import reverse_course_url
 from xmodule.x_module import STUDENT_VIEW
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
-from xmodule.tabs import CourseTabList, WikiTab
+from xmodule.tabs import CourseTabList, CoursewareTab, WikiTab
 from xmodule.modulestore.django import modulestore
 
 
@@ -175,6 +175,22 @@ class TabsPageTests(CourseTestCase):
         )
         self.check_invalid_tab_id_response(resp)
 
+    def test_toggle_unhideable_tab_visibility(self):
+        """Test toggling visibility of a tab that cannot be hidden"""
+
+        # post the request
+        resp = self.client.ajax_post(
+            self.url,
+            data=json.dumps({
+                'tab_id_locator': {'tab_id': CoursewareTab.type},
+                'is_hidden': True,
+            }),
+        )
+        self.assertEqual(resp.status_code, 400)
+        resp_content = json.loads(resp.content)
+        self.assertIn("error", resp_content)
+        self.assertIn(CoursewareTab.type, resp_content['error'])
+
     def test_tab_preview_html(self):
         """
         Verify that the static tab renders itself with the correct HTML
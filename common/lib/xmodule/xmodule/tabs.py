@@ -2,6 +2,7 @@
 Implement CourseTab
 """
 from abc import ABCMeta, abstractmethod
+from collections import Counter
 from xblock.fields import List
 
 # We should only scrape strings for i18n in this file, since the target language is known only when
@@ -9,6 +10,28 @@ from xblock.fields import List
 _ = lambda text: text
 
 
+def _get_slot_state(obj):
+    """
+    Returns a dict of the values of all the slots declared across the class hierarchy of the given object,
+    skipping slots that were never set.  Used by the slotted classes in this module to support pickling with
+    every protocol, since the default protocol would otherwise silently drop slot values.
+    """
+    state = {}
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get('__slots__', ()):
+            if hasattr(obj, slot):
+                state[slot] = getattr(obj, slot)
+    return state
+
+
+def _set_slot_state(obj, state):
+    """
+    Restores the slot values gathered by _get_slot_state onto the given object.
+    """
+    for slot, value in state.iteritems():
+        setattr(obj, slot, value)
+
+
 class CourseTab(object):
     """
     The Course Tab class is a data abstraction for all tabs (i.e., course navigation links) within a course.
@@ -31,6 +54,17 @@ class CourseTab(object):
     # Class property that specifies whether the tab is a collection of other tabs
     is_collection = False
 
+    # Maps the keys readable with the d[key] syntax to the names of the attributes that hold them.
+    # Subclasses with additional members extend these maps rather than overriding __getitem__.
+    _KEY_ATTR = {'name': 'name', 'type': 'type', 'tab_id': 'tab_id'}
+
+    # Maps the keys writable with the d[key]=value syntax to the names of the attributes that hold them.
+    _SET_ATTR = {'name': 'name', 'tab_id': 'tab_id'}
+
+    # Instance members are stored in slots rather than a per-instance __dict__ since a process holds
+    # many tabs.  Subclasses must declare __slots__ as well, listing any instance members they add.
+    __slots__ = ('name', 'tab_id', 'link_func')
+
     def __init__(self, name, tab_id, link_func):
         """
         Initializes class members with values passed in by subclasses.
@@ -96,14 +130,11 @@ class CourseTab(object):
         This method allows callers to access CourseTab members with the d[key] syntax as is done with
         Python dictionary objects.
         """
-        if key == 'name':
-            return self.name
-        elif key == 'type':
-            return self.type
-        elif key == 'tab_id':
-            return self.tab_id
-        else:
-            raise KeyError('Key {0} not present in tab {1}'.format(key, self.to_json()))
+        attr = self._KEY_ATTR.get(key)
+        if attr is None:
+            # misses are part of normal flow through get(), so keep raising cheap
+            raise KeyError(key)
+        return getattr(self, attr)
 
     def __setitem__(self, key, value):
         """
@@ -112,12 +143,10 @@ class CourseTab(object):
 
         Note: the 'type' member can be 'get', but not 'set'.
         """
-        if key == 'name':
-            self.name = value
-        elif key == 'tab_id':
-            self.tab_id = value
-        else:
-            raise KeyError('Key {0} cannot be set in tab {1}'.format(key, self.to_json()))
+        attr = self._SET_ATTR.get(key)
+        if attr is None:
+            raise KeyError(key)
+        setattr(self, attr, value)
 
     def __eq__(self, other):
         """
@@ -126,15 +155,17 @@ class CourseTab(object):
         was implemented).
         """
 
+        # only compare the persisted/serialized members: 'type' and 'name'.
+        # Compare the type first since it is cheap and rules out most tabs before running the validator.
+        if self.type != other.get('type'):
+            return False
+
         if isinstance(other, dict) and not self.validate(other, raise_error=False):
             # 'other' is a dict-type tab and did not validate
             return False
 
         # allow tabs without names; if a name is required, its presence was checked in the validator.
-        name_is_eq = (other.get('name') is None or self.name == other['name'])
-
-        # only compare the persisted/serialized members: 'type' and 'name'
-        return self.type == other.get('type') and name_is_eq
+        return other.get('name') is None or self.name == other['name']
 
     def __ne__(self, other):
         """
@@ -142,13 +173,22 @@ class CourseTab(object):
         """
         return not (self == other)
 
+    def __repr__(self):
+        return '{0}(type={1!r}, name={2!r})'.format(self.__class__.__name__, self.type, self.name)
+
+    def __getstate__(self):
+        return _get_slot_state(self)
+
+    def __setstate__(self, state):
+        _set_slot_state(self, state)
+
     @classmethod
     def validate(cls, tab_dict, raise_error=True):
         """
         Validates the given dict-type tab object to ensure it contains the expected keys.
         This method should be overridden by subclasses that require certain keys to be persisted in the tab.
         """
-        return key_checker(['type'])(tab_dict, raise_error)
+        return _check_type_key(tab_dict, raise_error)
 
     def to_json(self):
         """
@@ -174,35 +214,13 @@ class CourseTab(object):
         Raises:
             InvalidTabsException if the given tab doesn't have the right keys.
         """
-        sub_class_types = {
-            'courseware': CoursewareTab,
-            'course_info': CourseInfoTab,
-            'wiki': WikiTab,
-            'discussion': DiscussionTab,
-            'external_discussion': ExternalDiscussionTab,
-            'external_link': ExternalLinkTab,
-            'textbooks': TextbookTabs,
-            'pdf_textbooks': PDFTextbookTabs,
-            'html_textbooks': HtmlTextbookTabs,
-            'progress': ProgressTab,
-            'static_tab': StaticTab,
-            'peer_grading': PeerGradingTab,
-            'staff_grading': StaffGradingTab,
-            'open_ended': OpenEndedGradingTab,
-            'notes': NotesTab,
-            'edxnotes': EdxNotesTab,
-            'syllabus': SyllabusTab,
-            'instructor': InstructorTab,  # not persisted
-            'ccx_coach': CcxCoachTab,  # not persisted
-        }
-
         tab_type = tab_dict.get('type')
-        if tab_type not in sub_class_types:
+        tab_class = _TAB_TYPE_TO_CLASS.get(tab_type)
+        if tab_class is None:
             raise InvalidTabsException(
-                'Unknown tab type {0}. Known types: {1}'.format(tab_type, sub_class_types)
+                'Unknown tab type {0}. Known types: {1}'.format(tab_type, sorted(_TAB_TYPE_TO_CLASS))
             )
 
-        tab_class = sub_class_types[tab_dict['type']]
         tab_class.validate(tab_dict)
         return tab_class(tab_dict=tab_dict)
 
@@ -211,6 +229,8 @@ class AuthenticatedCourseTab(CourseTab):
     """
     Abstract class for tabs that can be accessed by only authenticated users.
     """
+    __slots__ = ()
+
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):
         return is_user_authenticated
 
@@ -219,6 +239,8 @@ class StaffTab(AuthenticatedCourseTab):
     """
     Abstract class for tabs that can be accessed by only users with staff access.
     """
+    __slots__ = ()
+
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):  # pylint: disable=unused-argument
         return is_user_staff
 
@@ -228,6 +250,8 @@ class EnrolledOrStaffTab(CourseTab):
     Abstract class for tabs that can be accessed by only users with staff access
     or users enrolled in the course.
     """
+    __slots__ = ()
+
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):  # pylint: disable=unused-argument
         return is_user_authenticated and (is_user_staff or is_user_enrolled)
 
@@ -236,8 +260,12 @@ class HideableTab(CourseTab):
     """
     Abstract class for tabs that are hideable
     """
+    __slots__ = ('is_hidden',)
     is_hideable = True
 
+    _KEY_ATTR = dict(CourseTab._KEY_ATTR, is_hidden='is_hidden')
+    _SET_ATTR = dict(CourseTab._SET_ATTR, is_hidden='is_hidden')
+
     def __init__(self, name, tab_id, link_func, tab_dict):
         super(HideableTab, self).__init__(
             name=name,
@@ -246,18 +274,6 @@ class HideableTab(CourseTab):
         )
         self.is_hidden = tab_dict.get('is_hidden', False) if tab_dict else False
 
-    def __getitem__(self, key):
-        if key == 'is_hidden':
-            return self.is_hidden
-        else:
-            return super(HideableTab, self).__getitem__(key)
-
-    def __setitem__(self, key, value):
-        if key == 'is_hidden':
-            self.is_hidden = value
-        else:
-            super(HideableTab, self).__setitem__(key, value)
-
     def to_json(self):
         to_json_val = super(HideableTab, self).to_json()
         if self.is_hidden:
@@ -274,6 +290,7 @@ class CoursewareTab(EnrolledOrStaffTab):
     """
     A tab containing the course content.
     """
+    __slots__ = ()
 
     type = 'courseware'
     is_movable = False
@@ -291,6 +308,7 @@ class CourseInfoTab(CourseTab):
     """
     A tab containing information about the course.
     """
+    __slots__ = ()
 
     type = 'course_info'
     is_movable = False
@@ -312,6 +330,7 @@ class ProgressTab(EnrolledOrStaffTab):
     """
     A tab containing information about the authenticated user's progress.
     """
+    __slots__ = ()
 
     type = 'progress'
 
@@ -338,6 +357,7 @@ class WikiTab(HideableTab):
     """
     A tab_dict containing the course wiki.
     """
+    __slots__ = ()
 
     type = 'wiki'
 
@@ -364,6 +384,7 @@ class DiscussionTab(EnrolledOrStaffTab):
     """
     A tab only for the new Berkeley discussion forums.
     """
+    __slots__ = ()
 
     type = 'discussion'
 
@@ -394,7 +415,10 @@ class LinkTab(CourseTab):
     """
     Abstract class for tabs that contain external links.
     """
-    link_value = ''
+    __slots__ = ('link_value',)
+
+    _KEY_ATTR = dict(CourseTab._KEY_ATTR, link='link_value')
+    _SET_ATTR = dict(CourseTab._SET_ATTR, link='link_value')
 
     def __init__(self, name, tab_id, link_value):
         self.link_value = link_value
@@ -404,18 +428,6 @@ class LinkTab(CourseTab):
             link_func=link_value_func(self.link_value),
         )
 
-    def __getitem__(self, key):
-        if key == 'link':
-            return self.link_value
-        else:
-            return super(LinkTab, self).__getitem__(key)
-
-    def __setitem__(self, key, value):
-        if key == 'link':
-            self.link_value = value
-        else:
-            super(LinkTab, self).__setitem__(key, value)
-
     def to_json(self):
         to_json_val = super(LinkTab, self).to_json()
         to_json_val.update({'link': self.link_value})
@@ -428,13 +440,14 @@ class LinkTab(CourseTab):
 
     @classmethod
     def validate(cls, tab_dict, raise_error=True):
-        return super(LinkTab, cls).validate(tab_dict, raise_error) and key_checker(['link'])(tab_dict, raise_error)
+        return super(LinkTab, cls).validate(tab_dict, raise_error) and _check_link_key(tab_dict, raise_error)
 
 
 class ExternalDiscussionTab(LinkTab):
     """
     A tab that links to an external discussion service.
     """
+    __slots__ = ()
 
     type = 'external_discussion'
 
@@ -451,6 +464,7 @@ class ExternalLinkTab(LinkTab):
     """
     A tab containing an external link.
     """
+    __slots__ = ()
     type = 'external_link'
 
     def __init__(self, tab_dict):
@@ -465,32 +479,24 @@ class StaticTab(CourseTab):
     """
     A custom tab.
     """
+    __slots__ = ('url_slug', 'locator')
     type = 'static_tab'
 
+    _KEY_ATTR = dict(CourseTab._KEY_ATTR, url_slug='url_slug')
+    _SET_ATTR = dict(CourseTab._SET_ATTR, url_slug='url_slug')
+
     @classmethod
     def validate(cls, tab_dict, raise_error=True):
-        return super(StaticTab, cls).validate(tab_dict, raise_error) and key_checker(['name', 'url_slug'])(tab_dict, raise_error)
+        return super(StaticTab, cls).validate(tab_dict, raise_error) and _check_static_tab_keys(tab_dict, raise_error)
 
     def __init__(self, tab_dict=None, name=None, url_slug=None):
         self.url_slug = tab_dict['url_slug'] if tab_dict else url_slug
         super(StaticTab, self).__init__(
             name=tab_dict['name'] if tab_dict else name,
             tab_id='static_tab_{0}'.format(self.url_slug),
-            link_func=lambda course, reverse_func: reverse_func(self.type, args=[course.id.to_deprecated_string(), self.url_slug]),
+            link_func=_StaticTabLink(self),
         )
 
-    def __getitem__(self, key):
-        if key == 'url_slug':
-            return self.url_slug
-        else:
-            return super(StaticTab, self).__getitem__(key)
-
-    def __setitem__(self, key, value):
-        if key == 'url_slug':
-            self.url_slug = value
-        else:
-            super(StaticTab, self).__setitem__(key, value)
-
     def to_json(self):
         to_json_val = super(StaticTab, self).to_json()
         to_json_val.update({'url_slug': self.url_slug})
@@ -507,6 +513,7 @@ class SingleTextbookTab(CourseTab):
     A tab representing a single textbook.  It is created temporarily when enumerating all textbooks within a
     Textbook collection tab.  It should not be serialized or persisted.
     """
+    __slots__ = ()
     type = 'single_textbook'
     is_movable = False
     is_collection_item = True
@@ -519,6 +526,7 @@ class TextbookTabsBase(AuthenticatedCourseTab):
     """
     Abstract class for textbook collection tabs classes.
     """
+    __slots__ = ()
     is_collection = True
 
     def __init__(self, tab_id):
@@ -542,6 +550,7 @@ class TextbookTabs(TextbookTabsBase):
     """
     A tab representing the collection of all textbook tabs.
     """
+    __slots__ = ()
     type = 'textbooks'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -567,6 +576,7 @@ class PDFTextbookTabs(TextbookTabsBase):
     """
     A tab representing the collection of all PDF textbook tabs.
     """
+    __slots__ = ()
     type = 'pdf_textbooks'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -589,6 +599,7 @@ class HtmlTextbookTabs(TextbookTabsBase):
     """
     A tab representing the collection of all Html textbook tabs.
     """
+    __slots__ = ()
     type = 'html_textbooks'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -611,13 +622,14 @@ class GradingTab(object):
     """
     Abstract class for tabs that involve Grading.
     """
-    pass
+    __slots__ = ()
 
 
 class StaffGradingTab(StaffTab, GradingTab):
     """
     A tab for staff grading.
     """
+    __slots__ = ()
     type = 'staff_grading'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -634,6 +646,7 @@ class PeerGradingTab(AuthenticatedCourseTab, GradingTab):
     """
     A tab for peer grading.
     """
+    __slots__ = ()
     type = 'peer_grading'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -650,6 +663,7 @@ class OpenEndedGradingTab(AuthenticatedCourseTab, GradingTab):
     """
     A tab for open ended grading.
     """
+    __slots__ = ()
     type = 'open_ended'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -666,6 +680,7 @@ class SyllabusTab(CourseTab):
     """
     A tab for the course syllabus.
     """
+    __slots__ = ()
     type = 'syllabus'
 
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):
@@ -684,6 +699,7 @@ class NotesTab(AuthenticatedCourseTab):
     """
     A tab for the course notes.
     """
+    __slots__ = ()
     type = 'notes'
 
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):
@@ -705,6 +721,7 @@ class EdxNotesTab(AuthenticatedCourseTab):
     """
     A tab for the course student notes.
     """
+    __slots__ = ()
     type = 'edxnotes'
 
     def can_display(self, course, settings, is_user_authenticated, is_user_staff, is_user_enrolled):
@@ -726,6 +743,7 @@ class InstructorTab(StaffTab):
     """
     A tab for the course instructors.
     """
+    __slots__ = ()
     type = 'instructor'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -742,6 +760,7 @@ class CcxCoachTab(CourseTab):
     """
     A tab for the custom course coaches.
     """
+    __slots__ = ()
     type = 'ccx_coach'
 
     def __init__(self, tab_dict=None):  # pylint: disable=unused-argument
@@ -788,14 +807,14 @@ class CourseTabList(List):
         within the course.
         """
 
-        course.tabs.extend([
+        default_tabs = [
             CoursewareTab(),
             CourseInfoTab(),
-        ])
+        ]
 
         # Presence of syllabus tab is indicated by a course attribute
         if hasattr(course, 'syllabus_present') and course.syllabus_present:
-            course.tabs.append(SyllabusTab())
+            default_tabs.append(SyllabusTab())
 
         # If the course has a discussion link specified, use that even if we feature
         # flag discussions off. Disabling that is mostly a server safety feature
@@ -805,13 +824,16 @@ class CourseTabList(List):
         else:
             discussion_tab = DiscussionTab()
 
-        course.tabs.extend([
+        default_tabs.extend([
             TextbookTabs(),
             discussion_tab,
             WikiTab(),
             ProgressTab(),
         ])
 
+        # Mutate the course's tab field only once
+        course.tabs.extend(default_tabs)
+
     @staticmethod
     def get_discussion(course):
         """
@@ -824,17 +846,16 @@ class CourseTabList(List):
             return ExternalDiscussionTab(link_value=course.discussion_link)
 
         # find one of the discussion tab types in the course tabs
-        for tab in course.tabs:
-            if isinstance(tab, DiscussionTab) or isinstance(tab, ExternalDiscussionTab):
-                return tab
-        return None
+        return next((tab for tab in course.tabs if isinstance(tab, (DiscussionTab, ExternalDiscussionTab))), None)
 
     @staticmethod
     def get_tab_by_slug(tab_list, url_slug):
         """
         Look for a tab with the specified 'url_slug'.  Returns the tab or None if not found.
         """
-        return next((tab for tab in tab_list if tab.get('url_slug') == url_slug), None)
+        # Only StaticTabs have a url_slug; reading the attribute directly avoids raising and
+        # formatting a KeyError for every other tab in the list.
+        return next((tab for tab in tab_list if getattr(tab, 'url_slug', None) == url_slug), None)
 
     @staticmethod
     def get_tab_by_type(tab_list, tab_type):
@@ -889,8 +910,8 @@ class CourseTabList(List):
         """
         for tab in course.tabs:
             if tab.can_display(course, settings, is_user_authenticated=True, is_user_staff=True, is_user_enrolled=True):
-                if tab.is_collection and not len(list(tab.items(course))):
-                    # do not yield collections that have no items
+                if tab.is_collection and next(iter(tab.items(course)), None) is None:
+                    # do not yield collections that have no items; only the first item is generated
                     continue
                 yield tab
 
@@ -920,22 +941,17 @@ class CourseTabList(List):
                 "Expected second tab to have type 'course_info'.  tabs: '{0}'".format(tabs))
 
         # the following tabs should appear only once
-        for tab_type in [
-                CoursewareTab.type,
-                CourseInfoTab.type,
-                NotesTab.type,
-                TextbookTabs.type,
-                PDFTextbookTabs.type,
-                HtmlTextbookTabs.type,
-                EdxNotesTab.type]:
-            cls._validate_num_tabs_of_type(tabs, tab_type, 1)
+        tab_type_counts = Counter(tab.get('type') for tab in tabs)
+        for tab_type in _UNIQUE_TAB_TYPES:
+            cls._validate_num_tabs_of_type(tab_type_counts, tab_type, 1)
 
     @staticmethod
-    def _validate_num_tabs_of_type(tabs, tab_type, max_num):
+    def _validate_num_tabs_of_type(tab_type_counts, tab_type, max_num):
         """
-        Check that the number of times that the given 'tab_type' appears in 'tabs' is less than or equal to 'max_num'.
+        Check that the number of times that the given 'tab_type' appears in 'tab_type_counts', a Counter of the
+        types in the tab list, is less than or equal to 'max_num'.
         """
-        count = sum(1 for tab in tabs if tab.get('type') == tab_type)
+        count = tab_type_counts[tab_type]
         if count > max_num:
             msg = (
                 "Tab of type '{type}' appears {count} time(s). "
@@ -949,16 +965,14 @@ class CourseTabList(List):
         """
         Overrides the to_json method to serialize all the CourseTab objects to a json-serializable representation.
         """
-        json_data = []
-        if values:
-            for val in values:
-                if isinstance(val, CourseTab):
-                    json_data.append(val.to_json())
-                elif isinstance(val, dict):
-                    json_data.append(val)
-                else:
-                    continue
-        return json_data
+        if not values:
+            return []
+        # dict-type tabs are passed through as is; values of any other type are dropped
+        return [
+            val.to_json() if isinstance(val, CourseTab) else val
+            for val in values
+            if isinstance(val, (CourseTab, dict))
+        ]
 
     def from_json(self, values):
         """
@@ -968,20 +982,110 @@ class CourseTabList(List):
         return [CourseTab.from_json(tab_dict) for tab_dict in values]
 
 
+# Maps each persisted tab type to the CourseTab subclass that deserializes it.  Built once at import
+# time so that CourseTab.from_json is a single dict lookup per tab.
+_TAB_TYPE_TO_CLASS = {
+    'courseware': CoursewareTab,
+    'course_info': CourseInfoTab,
+    'wiki': WikiTab,
+    'discussion': DiscussionTab,
+    'external_discussion': ExternalDiscussionTab,
+    'external_link': ExternalLinkTab,
+    'textbooks': TextbookTabs,
+    'pdf_textbooks': PDFTextbookTabs,
+    'html_textbooks': HtmlTextbookTabs,
+    'progress': ProgressTab,
+    'static_tab': StaticTab,
+    'peer_grading': PeerGradingTab,
+    'staff_grading': StaffGradingTab,
+    'open_ended': OpenEndedGradingTab,
+    'notes': NotesTab,
+    'edxnotes': EdxNotesTab,
+    'syllabus': SyllabusTab,
+    'instructor': InstructorTab,  # not persisted
+    'ccx_coach': CcxCoachTab,  # not persisted
+}
+
+
+# Tab types that may appear at most once in a course's tab list.
+_UNIQUE_TAB_TYPES = (
+    CoursewareTab.type,
+    CourseInfoTab.type,
+    NotesTab.type,
+    TextbookTabs.type,
+    PDFTextbookTabs.type,
+    HtmlTextbookTabs.type,
+    EdxNotesTab.type,
+)
+
+
 #### Link Functions
+class _LinkFunc(object):
+    """
+    Base class for the link functions held by tabs.  Link functions are classes rather than closures
+    so that tabs holding them can be pickled.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return _get_slot_state(self)
+
+    def __setstate__(self, state):
+        _set_slot_state(self, state)
+
+
+class _ReverseLink(_LinkFunc):
+    """
+    Link function that calls the reverse_url_func with the given reverse_name and course' ID.
+    """
+    __slots__ = ('reverse_name',)
+
+    def __init__(self, reverse_name):
+        self.reverse_name = reverse_name
+
+    def __call__(self, course, reverse_url_func):
+        return reverse_url_func(self.reverse_name, args=[course.id.to_deprecated_string()])
+
+
+class _ValueLink(_LinkFunc):
+    """
+    Link function that returns the given value.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, course, reverse_url_func):  # pylint: disable=unused-argument
+        return self.value
+
+
+class _StaticTabLink(_LinkFunc):
+    """
+    Link function for a StaticTab.  It holds the tab itself so that the link follows changes to the tab's url_slug.
+    """
+    __slots__ = ('tab',)
+
+    def __init__(self, tab):
+        self.tab = tab
+
+    def __call__(self, course, reverse_url_func):
+        return reverse_url_func(self.tab.type, args=[course.id.to_deprecated_string(), self.tab.url_slug])
+
+
 def link_reverse_func(reverse_name):
     """
     Returns a function that takes in a course and reverse_url_func,
     and calls the reverse_url_func with the given reverse_name and course' ID.
     """
-    return lambda course, reverse_url_func: reverse_url_func(reverse_name, args=[course.id.to_deprecated_string()])
+    return _ReverseLink(reverse_name)
 
 
 def link_value_func(value):
     """
     Returns a function takes in a course and reverse_url_func, and returns the given value.
     """
-    return lambda course, reverse_url_func: value
+    return _ValueLink(value)
 
 
 #### Validators
@@ -991,12 +1095,13 @@ def key_checker(expected_keys):
     """
     Returns a function that checks that specified keys are present in a dict.
     """
+    expected_key_set = frozenset(expected_keys)
 
     def check(actual_dict, raise_error=True):
         """
         Function that checks whether all keys in the expected_keys object is in the given actual_dict object.
         """
-        missing = set(expected_keys) - set(actual_dict.keys())
+        missing = expected_key_set.difference(actual_dict)
         if not missing:
             return True
         if raise_error:
@@ -1009,11 +1114,19 @@ def key_checker(expected_keys):
     return check
 
 
+# Validators are called for every tab on each deserialization, so the ones used by the tab classes are built
+# once here rather than on each call.
+_check_type_key = key_checker(['type'])
+_check_name_key = key_checker(['name'])
+_check_link_key = key_checker(['link'])
+_check_static_tab_keys = key_checker(['name', 'url_slug'])
+
+
 def need_name(dictionary, raise_error=True):
     """
     Returns whether the 'name' key exists in the given dictionary.
     """
-    return key_checker(['name'])(dictionary, raise_error)
+    return _check_name_key(dictionary, raise_error)
 
 
 class InvalidTabsException(Exception):
@@ -1,5 +1,6 @@
 """Tests for Tab classes"""
 from mock import MagicMock
+import pickle
 import xmodule.tabs as tabs
 import unittest
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
@@ -447,6 +448,37 @@ class EdxNotesTestCase(TabTestCase):
         self.check_can_display_results(tab, expected_value=False)
 
 
+class LinkFuncTestCase(TabTestCase):
+    """Test cases for the link functions of tabs."""
+
+    def test_pickled_tab_links(self):
+        for tab in [
+                tabs.ProgressTab(),
+                tabs.ExternalLinkTab({'type': tabs.ExternalLinkTab.type, 'name': 'same', 'link': 'link_value'}),
+                tabs.StaticTab({'type': tabs.StaticTab.type, 'name': 'same', 'url_slug': 'schmug'}),
+        ]:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                unpickled_tab = pickle.loads(pickle.dumps(tab, protocol))
+                self.assertEquals(unpickled_tab, tab)
+                self.assertEquals(unpickled_tab.name, tab.name)
+                self.assertEquals(unpickled_tab.tab_id, tab.tab_id)
+                self.assertEquals(unpickled_tab.to_json(), tab.to_json())
+                self.assertEquals(
+                    unpickled_tab.link_func(self.course, self.reverse),
+                    tab.link_func(self.course, self.reverse),
+                )
+
+    def test_static_tab_link_follows_url_slug(self):
+        tab = tabs.StaticTab(name='same', url_slug='schmug')
+        unpickled_tab = pickle.loads(pickle.dumps(tab))
+        for static_tab in [tab, unpickled_tab]:
+            static_tab['url_slug'] = 'new_slug'
+            self.assertEquals(
+                static_tab.link_func(self.course, self.reverse),
+                self.reverse('static_tab', args=[self.course.id.to_deprecated_string(), 'new_slug']),
+            )
+
+
 class KeyCheckerTestCase(unittest.TestCase):
     """Test cases for KeyChecker class"""
 
@@ -659,6 +691,11 @@ class CourseTabListTestCase(TabListTestCase):
             # get tab by id
             self.assertEquals(tabs.CourseTabList.get_tab_by_id(self.course.tabs, tab.tab_id), tab)
 
+        # get tab by slug
+        static_tab = tabs.CourseTabList.get_tab_by_type(self.course.tabs, tabs.StaticTab.type)
+        self.assertEquals(tabs.CourseTabList.get_tab_by_slug(self.course.tabs, 'schlug'), static_tab)
+        self.assertIsNone(tabs.CourseTabList.get_tab_by_slug(self.course.tabs, 'fake_slug'))
+
 
 class DiscussionLinkTestCase(TabTestCase):
     """Test cases for discussion link tab."""
@@ -33,9 +33,11 @@ def get_course_tab_list(course, user):
     # We don't have access to the true request object in this context, but we can use a mock
     request = RequestFactory().request()
     request.user = user
+    # The entrance exam check queries the milestones tables, so evaluate it once rather than per tab
+    must_complete_entrance_exam = user_must_complete_entrance_exam(request, user, course)
     course_tab_list = []
     for tab in xmodule_tab_list:
-        if user_must_complete_entrance_exam(request, user, course):
+        if must_complete_entrance_exam:
             # Hide all of the tabs except for 'Courseware' and 'Instructor'
             # Rename 'Courseware' tab to 'Entrance Exam'
             if tab.type not in ['courseware', 'instructor']:
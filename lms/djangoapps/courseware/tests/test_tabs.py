@@ -13,6 +13,7 @@ from courseware.courses import get_course_by_id
 from courseware.tests.helpers import get_request_for_user, LoginEnrollmentTestCase
 from courseware.tests.factories import InstructorFactory, StaffFactory
 from xmodule import tabs
+from xmodule.course_module import Textbook
 from xmodule.modulestore.tests.django_utils import (
     TEST_DATA_MIXED_TOY_MODULESTORE, TEST_DATA_MIXED_CLOSED_MODULESTORE
 )
@@ -44,14 +45,12 @@ class StaticTabDateTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase):
         self.setup_user()
         url = reverse('static_tab', args=[self.course.id.to_deprecated_string(), 'new_tab'])
         resp = self.client.get(url)
-        self.assertEqual(resp.status_code, 200)
-        self.assertIn("OOGIE BLOOGIE", resp.content)
+        self.assertContains(resp, "OOGIE BLOOGIE")
 
     def test_anonymous_user(self):
         url = reverse('static_tab', args=[self.course.id.to_deprecated_string(), 'new_tab'])
         resp = self.client.get(url)
-        self.assertEqual(resp.status_code, 200)
-        self.assertIn("OOGIE BLOOGIE", resp.content)
+        self.assertContains(resp, "OOGIE BLOOGIE")
 
     def test_invalid_course_key(self):
         request = get_request_for_user(UserFactory.create())
@@ -100,15 +99,13 @@ class StaticTabDateTestCaseXML(LoginEnrollmentTestCase, ModuleStoreTestCase):
         self.setup_user()
         url = reverse('static_tab', args=[self.xml_course_key.to_deprecated_string(), self.xml_url])
         resp = self.client.get(url)
-        self.assertEqual(resp.status_code, 200)
-        self.assertIn(self.xml_data, resp.content)
+        self.assertContains(resp, self.xml_data)
 
     @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
     def test_anonymous_user_xml(self):
         url = reverse('static_tab', args=[self.xml_course_key.to_deprecated_string(), self.xml_url])
         resp = self.client.get(url)
-        self.assertEqual(resp.status_code, 200)
-        self.assertIn(self.xml_data, resp.content)
+        self.assertContains(resp, self.xml_data)
 
 
 @attr('shard_1')
@@ -244,12 +241,14 @@ class TextBookTabsTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase):
 
     def set_up_books(self, num_books):
         """Initializes the textbooks in the course and adds the given number of books to each textbook"""
-        self.books = [MagicMock() for _ in range(num_books)]
-        for book_index, book in enumerate(self.books):
-            book.title = 'Book{0}'.format(book_index)
+        self.books = [
+            Textbook('Book{0}'.format(book_index), 'http://example.com/book{0}/'.format(book_index))
+            for book_index in range(num_books)
+        ]
         self.course.textbooks = self.books
-        self.course.pdf_textbooks = self.books
-        self.course.html_textbooks = self.books
+        # pdf and html textbooks are persisted as dicts rather than Textbook objects
+        self.course.pdf_textbooks = [{'tab_title': book.title} for book in self.books]
+        self.course.html_textbooks = [{'tab_title': book.title} for book in self.books]
 
     def test_pdf_textbook_tabs(self):
         """